@@ -1,19 +1,32 @@
-from typing import List  # Provides support for type hints.
+from collections import deque  # Bounded ring buffer for the calculation history.
+from typing import Deque, List  # Provides support for type hints.
 # Documentation: https://docs.python.org/3/library/typing.html
 
+from app.operations.batch import BatchSummary, perform_batch
 from app.operations.calculation import Calculation
 from app.operations.template_operation import TemplateOperation
 from app.history import HistoryObserver
 from app.history.logger import logging
 
+# Module-level logger; %-style arguments defer formatting until a handler
+# actually needs the message, so disabled levels cost nothing.
+log = logging.getLogger(__name__)
+
 class CalculatorWithObserver:
     """
     Calculator class with observer support for tracking calculation history.
     Maintains a list of observers and notifies them of changes.
     """
+    # Maximum number of calculations retained; older entries are evicted.
+    HISTORY_CAPACITY = 10_000
+
     def __init__(self):
-        self._history: List[Calculation] = []  # List to store calculation history.
+        # Ring buffer for calculation history: O(1) bounded append, with the
+        # oldest entries dropped automatically once capacity is reached.
+        self._history: Deque[Calculation] = deque(maxlen=self.HISTORY_CAPACITY)
         self._observers: List[HistoryObserver] = []  # List of observers.
+        self._pending: List[Calculation] = []  # Calculations not yet delivered to observers.
+        self._batch_size = 64  # Deliver pending notifications once this many accumulate.
 
     def add_observer(self, observer: HistoryObserver):
         """
@@ -22,17 +35,34 @@ class CalculatorWithObserver:
         - observer (HistoryObserver): The observer to add.
         """
         self._observers.append(observer)  # Add the observer to the list.
-        logging.debug(f"Observer added: {observer}")  # Log the addition.
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Observer added: %r", observer)  # Log the addition.
 
     def notify_observers(self, calculation):
         """
-        Notifies all observers when a new calculation is added.
+        Queues a notification for observers, delivering in micro-batches.
+        Observers see O(operations / batch_size) bulk updates instead of one
+        Python-level dispatch (plus a log record) per calculation.
         Parameters:
         - calculation (Calculation): The calculation object that was added.
         """
+        self._pending.append(calculation)  # Buffer the notification.
+        if len(self._pending) >= self._batch_size:
+            self.flush()  # Deliver a full batch.
+
+    def flush(self):
+        """
+        Delivers all pending notifications to every observer as one batch.
+        Called automatically when the buffer fills, and by the REPL on
+        'list' and 'exit' so observers never lag behind the user.
+        """
+        if not self._pending:
+            return
         for observer in self._observers:
-            observer.update(calculation)  # Call the update method on the observer.
-            logging.debug(f"Notified observer about: {calculation}")  # Log the notification.
+            observer.update_batch(self._pending)  # One bulk update per observer.
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Notified observer about %d calculations", len(self._pending))
+        self._pending.clear()  # Reset the buffer.
 
     def perform_operation(self, operation: TemplateOperation, a: float, b: float):
         """
@@ -44,11 +74,50 @@ class CalculatorWithObserver:
         Returns:
         - The result of the operation.
         """
-        calculation = Calculation(operation, a, b)  # Create a new Calculation object.
+        # Use the kernel specialized for these operand types; for floats this
+        # skips redundant validation and the Template Method indirection.
+        kernel = operation.specialize(type(a), type(b))
+        result = kernel(operation, a, b)  # Execute the calculation exactly once.
+        calculation = Calculation(operation, a, b, result)  # Cache the result on the record.
         self._history.append(calculation)  # Add the calculation to the history.
         self.notify_observers(calculation)  # Notify observers of the new calculation.
-        logging.debug(f"Performed operation: {calculation}")  # Log the operation.
-        return operation.calculate(a, b)  # Execute the calculation and return the result.
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Performed operation: %r", calculation)  # Log the operation.
+        return result  # Return the cached result.
+
+    def get_history(self) -> List[Calculation]:
+        """
+        Returns the retained calculation history as a list.
+        Materialized on demand; the internal ring buffer stays bounded.
+        """
+        return list(self._history)
+
+    def clear_history(self):
+        """
+        Clears the retained history along with any pending notifications.
+        Pending entries refer to calculations being discarded; delivering
+        them later would tell observers about history that no longer exists.
+        """
+        self._pending.clear()  # Drop undelivered notifications first.
+        self._history.clear()  # Then empty the ring buffer.
+
+    def perform_batch(self, operation: str, a, b):
+        """
+        Performs one operation over many operand pairs in a single call.
+        Records a single BatchSummary in history and notifies observers once,
+        instead of once per element.
+        Parameters:
+        - operation (str): The operation name (e.g., 'add').
+        - a: Sequence of first operands.
+        - b: Sequence of second operands.
+        Returns:
+        - The sequence of results (ndarray when NumPy is available).
+        """
+        results = perform_batch(operation, a, b)  # One vectorized dispatch.
+        summary = BatchSummary(operation, len(results))  # One summary entry.
+        self._history.append(summary)  # Record the batch in history.
+        self.notify_observers(summary)  # Notify observers once for the batch.
+        return results
 
 # Why use the Observer Pattern?
 # - Decouples the calculator from the observers, allowing for dynamic addition/removal of observers.
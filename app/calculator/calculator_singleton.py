@@ -9,16 +9,79 @@
 # When: Throughout the application's lifecycle.
 # How: By controlling instance creation using the __new__ method.
 
+import array  # Typed, contiguous storage for the struct-of-arrays history.
+
 from app.operations.template_operation import TemplateOperation
 from app.history.logger import logging
 from app.operations.calculation import Calculation
 
+# Module-level logger with %-style deferred formatting; see calculator_observer.
+log = logging.getLogger(__name__)
+
+# Opcode registry shared by the history columns: each operation class gets a
+# small integer the first time it is recorded, so the per-entry operation
+# column is one unsigned byte instead of an object pointer.
+_OP_CODES = {}  # Operation class -> opcode.
+_OP_TABLE = []  # Opcode -> shared (singleton) operation instance.
+
+class _HistoryView:
+    """
+    Sequence view over the singleton's struct-of-arrays history.
+    Indexing reconstructs a Calculation lazily from the parallel columns, so
+    existing callers (len, history[-1], iteration, clear) keep working while
+    aggregate queries can read a contiguous column directly — for example
+    sum(view.results()) touches one float buffer with no pointer chasing.
+    """
+    __slots__ = ('_ops', '_a', '_b', '_r')
+
+    def __init__(self, ops, a, b, r):
+        self._ops = ops  # array('B'): opcodes into _OP_TABLE.
+        self._a = a      # array('d'): first operands.
+        self._b = b      # array('d'): second operands.
+        self._r = r      # array('d'): cached results.
+
+    def __len__(self):
+        return len(self._ops)
+
+    def __getitem__(self, index):
+        """Reconstructs the Calculation at index (negative indices and
+        slices behave like a list's). Entries are built on demand; nothing
+        is boxed until someone actually asks for a record."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._ops)))]
+        # array.array raises IndexError past the end, which also terminates
+        # plain iteration over the view.
+        return Calculation(
+            _OP_TABLE[self._ops[index]], self._a[index], self._b[index], self._r[index]
+        )
+
+    def results(self):
+        """The contiguous result column, for vectorizable aggregates."""
+        return self._r
+
+    def clear(self):
+        """Empties all four columns in place."""
+        del self._ops[:]  # array.array has no clear(); slice-delete instead.
+        del self._a[:]
+        del self._b[:]
+        del self._r[:]
+
 class SingletonCalculator:
     """
     A calculator using the Singleton pattern to ensure only one instance exists.
     """
+    __slots__ = ()  # All state is class-level; instances need no __dict__.
+
     _instance = None  # Class variable to hold the singleton instance.
 
+    # Maximum number of calculations retained; older entries are evicted.
+    HISTORY_CAPACITY = 10_000
+
+    # Oldest entries are dropped in blocks of this size once the capacity is
+    # exceeded, so the O(n) front-trim is amortized over many appends. The
+    # history may briefly hold up to HISTORY_CAPACITY + _TRIM_CHUNK entries.
+    _TRIM_CHUNK = 1_024
+
     def __new__(cls):
         """
         Overrides the __new__ method to control the creation of a new instance.
@@ -26,7 +89,18 @@ class SingletonCalculator:
         """
         if cls._instance is None:
             cls._instance = super(SingletonCalculator, cls).__new__(cls)  # Call the superclass __new__ method.
-            cls._history = []  # Initialize the shared history.
+            # Shared history in struct-of-arrays layout: four parallel typed
+            # columns instead of a container of Calculation objects. Appends
+            # write one byte and three unboxed doubles (~25 bytes per entry
+            # versus ~200 for a boxed record), and aggregate traversals scan
+            # contiguous buffers.
+            cls._ops = array.array('B')  # Opcodes into _OP_TABLE.
+            cls._operands_a = array.array('d')
+            cls._operands_b = array.array('d')
+            cls._results = array.array('d')
+            cls._history = _HistoryView(
+                cls._ops, cls._operands_a, cls._operands_b, cls._results
+            )
             logging.info("SingletonCalculator instance created.")  # Log the creation.
         return cls._instance  # Return the singleton instance.
 
@@ -40,19 +114,36 @@ class SingletonCalculator:
         Returns:
         - The result of the operation.
         """
-        calculation = Calculation(operation, a, b)  # Create a new Calculation object.
-        self._history.append(calculation)  # Add the calculation to the shared history.
-        logging.debug(f"SingletonCalculator: Performed operation -> {calculation}")  # Log the operation.
-        return operation.calculate(a, b)  # Execute the calculation and return the result.
+        result = operation.calculate(a, b)  # Execute the calculation exactly once.
+        # Register the operation class on first sight; thereafter one dict
+        # lookup yields its one-byte opcode.
+        code = _OP_CODES.get(type(operation))
+        if code is None:
+            code = len(_OP_TABLE)
+            _OP_CODES[type(operation)] = code
+            _OP_TABLE.append(operation)
+        self._ops.append(code)  # Append one row across the four columns.
+        self._operands_a.append(a)
+        self._operands_b.append(b)
+        self._results.append(result)
+        if len(self._ops) >= self.HISTORY_CAPACITY + self._TRIM_CHUNK:
+            # Evict the oldest block so the history stays bounded.
+            del self._ops[:self._TRIM_CHUNK]
+            del self._operands_a[:self._TRIM_CHUNK]
+            del self._operands_b[:self._TRIM_CHUNK]
+            del self._results[:self._TRIM_CHUNK]
+        if log.isEnabledFor(logging.DEBUG):
+            # Box a record only when DEBUG logging will actually render it.
+            log.debug("SingletonCalculator: Performed operation -> %r",
+                      Calculation(operation, a, b, result))
+        return result  # Return the cached result.
 
     def get_history(self):
         """
-        Returns the history of calculations.
-        Includes a breakpoint for debugging using pdb.
+        Returns the history of calculations as a lazy sequence view.
         """
-       # pdb.set_trace()  # Pause execution here for debugging.
-        return self._history  # Return the shared history list.
+        return self._history  # Return the shared history view.
 
 # Why use the Singleton Pattern?
 # - To control access to a shared resource.
-# - Ensures that there's only one point of interaction with the resource.
\ No newline at end of file
+# - Ensures that there's only one point of interaction with the resource.
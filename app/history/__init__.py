@@ -1,5 +1,8 @@
 from app.history.logger import logging
 
+# Module-level logger with %-style deferred formatting; see calculator_observer.
+log = logging.getLogger(__name__)
+
 # ==============================================================================
 # OBSERVER PATTERN FOR TRACKING HISTORY
 # ==============================================================================
@@ -16,6 +19,8 @@ class HistoryObserver:
     Observer that gets notified whenever a new calculation is added to history.
     Implements the Observer Pattern.
     """
+    __slots__ = ()  # Stateless; no per-instance __dict__ needed.
+
     def update(self, calculation):
         """
         Called when a new calculation is added to the history.
@@ -23,4 +28,15 @@ class HistoryObserver:
         - calculation (Calculation): The calculation object that was added.
         """
         # Log the notification at INFO level.
-        logging.info(f"Observer: New calculation added -> {calculation}")
\ No newline at end of file
+        log.info("Observer: New calculation added -> %s", calculation)
+
+    def update_batch(self, calculations):
+        """
+        Called with a batch of calculations accumulated by the calculator.
+        One bulk notification replaces a log record per calculation.
+        Parameters:
+        - calculations (list[Calculation]): The batch of added calculations.
+        """
+        # A single INFO record summarizes the whole batch.
+        log.info("Observer: batch of %d calculations ending at %r",
+                 len(calculations), calculations[-1])
\ No newline at end of file
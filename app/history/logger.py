@@ -1,5 +1,11 @@
+import atexit  # For flushing buffered log records when the interpreter exits.
 import logging  # Standard Python module for logging events and messages.
+import logging.config  # Declarative configuration via dictConfig.
 # Documentation: https://docs.python.org/3/library/logging.html
+import os  # For the CALC_DEBUG toggle and low-level file descriptor control.
+import queue  # Thread-safe queue used to hand records to the background listener.
+from logging.handlers import QueueHandler, QueueListener
+# Documentation: https://docs.python.org/3/library/logging.handlers.html
 
 # ==============================================================================
 # SETUP LOGGING CONFIGURATION
@@ -8,12 +14,105 @@ import logging  # Standard Python module for logging events and messages.
 # Configure the logging settings for the application.
 # Logging is crucial for tracking events and diagnosing issues in applications.
 
-logging.basicConfig(
-    filename='calculator.log',  # Specifies the file to write log messages to.
-    level=logging.DEBUG,  # Sets the logging level to DEBUG; captures all levels (DEBUG, INFO, WARNING, ERROR, CRITICAL).
-    format='%(asctime)s - %(levelname)s - %(message)s'  # Defines the format of the log messages.
-    # Format placeholders:
-    # %(asctime)s - Timestamp of the log entry.
-    # %(levelname)s - Severity level of the log message.
-    # %(message)s - The actual log message.
-)
\ No newline at end of file
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler variant that writes through a large BufferedWriter instead of a
+    line-buffered text stream, coalescing many small log writes into one syscall.
+    WARNING and above still flush immediately to preserve crash-time durability.
+    """
+    def _open(self):
+        """
+        Opens one long-lived O_APPEND descriptor for the log file, wrapped
+        in a 64 KiB binary buffer. Append-mode writes go straight to the end
+        of the file with no seek, and the descriptor stays open for the life
+        of the handler.
+        """
+        fd = os.open(self.baseFilename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return os.fdopen(fd, 'ab', buffering=65536)
+
+    def flush(self):
+        """
+        Flushes the write buffer, then tells the kernel the flushed pages
+        will not be read back, so log data does not pollute the page cache.
+        """
+        super().flush()
+        if self.stream is not None and hasattr(os, 'posix_fadvise'):  # Not on macOS/Windows.
+            try:
+                os.posix_fadvise(self.stream.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            except OSError:  # pragma: no cover - advisory only; never fail a flush.
+                pass
+
+    def emit(self, record):
+        """
+        Formats the record and writes it to the buffered binary stream.
+        Flushes only for WARNING and above; lower levels stay buffered.
+        """
+        try:
+            msg = self.format(record)
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write((msg + self.terminator).encode('utf-8'))
+            if record.levelno >= logging.WARNING:
+                self.flush()  # Keep severe records durable even on crash.
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+LOG_FILENAME = 'calculator.log'  # Specifies the file to write log messages to.
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'  # Defines the format of the log messages.
+# Format placeholders:
+# %(asctime)s - Timestamp of the log entry.
+# %(levelname)s - Severity level of the log message.
+# %(message)s - The actual log message.
+
+def _make_queued_file_handler():
+    """
+    Handler factory referenced from LOGGING_CONFIG.
+    Builds the buffered file handler (the single writer owning the one open
+    file descriptor), starts the background QueueListener that feeds it, and
+    returns the cheap QueueHandler that callers actually log through.
+    """
+    file_handler = BufferedFileHandler(LOG_FILENAME)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue = queue.Queue(-1)  # Unbounded queue between callers and the listener thread.
+
+    # The listener drains the queue on its own thread and feeds the file handler.
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+
+    # At interpreter exit, drain the queue first, then flush the write buffer.
+    # atexit runs callbacks in reverse registration order, so flush is
+    # registered before stop.
+    atexit.register(file_handler.flush)
+    atexit.register(listener.stop)
+
+    return QueueHandler(log_queue)
+
+# Verbose logging is opt-in: a silent REPL session should not fill the log
+# with per-keystroke DEBUG records. Setting CALC_DEBUG in the environment
+# restores full DEBUG capture; the default admits WARNING and above only.
+# Filtering at the logger level is the cheapest possible place — no
+# LogRecord is even constructed for suppressed levels.
+LOG_LEVEL = 'DEBUG' if os.environ.get('CALC_DEBUG') else 'WARNING'
+
+# Single declarative configuration for the whole application: one handler,
+# one open file descriptor, one formatter. Individual modules obtain their
+# loggers via logging.getLogger(__name__) and records propagate to the root.
+LOGGING_CONFIG = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'queued_file': {
+            '()': _make_queued_file_handler,
+            # Mirror the level on the queue handler so records filtered at
+            # the root never even enter the queue.
+            'level': LOG_LEVEL,
+        },
+    },
+    'root': {
+        'level': LOG_LEVEL,
+        'handlers': ['queued_file'],
+    },
+}
+
+logging.config.dictConfig(LOGGING_CONFIG)
\ No newline at end of file
@@ -6,14 +6,15 @@
 
 from app.history.logger import logging  # Import the logging instance
 
-import pdb  # Python debugger for interactive debugging sessions.
-# Documentation: https://docs.python.org/3/library/pdb.html
+import re  # Precompiled pattern for REPL input parsing.
+import sys  # For reading stdin directly in the REPL loop.
 
 from typing import List
 
-from app.calculator.calculator_observer import CalculatorWithObserver  # Use relative import
-from app.history import HistoryObserver
-from app.operations.operation_factory import OperationFactory
+# The calculator, observer, and operation classes are imported lazily inside
+# calculator(): importing them here would pull in the whole operations stack
+# (batch dispatch tables and, when installed, NumPy/Numba kernel compilation)
+# just to import this module, slowing test collection and CLI cold start.
 
 # Documentation: https://docs.python.org/3/library/typing.html
 
@@ -28,12 +29,78 @@ from app.operations.operation_factory import OperationFactory
 # When: When the script is run directly.
 # How: By implementing a Read-Eval-Print Loop (REPL).
 
+def _print_help(calc):
+    """Prints the list of available commands."""
+    print("\nAvailable commands:")
+    print("  add <num1> <num2>       : Add two numbers.")
+    print("  subtract <num1> <num2>  : Subtract the second number from the first.")
+    print("  multiply <num1> <num2>  : Multiply two numbers.")
+    print("  divide <num1> <num2>    : Divide the first number by the second.")
+    print("  list                    : Show the calculation history.")
+    print("  clear                   : Clear the calculation history.")
+    print("  exit                    : Exit the calculator.\n")
+
+def _print_history(calc):
+    """Prints the calculation history, or a notice if it is empty."""
+    calc.flush()  # Deliver any pending observer notifications first.
+    history = calc.get_history()  # Materialized snapshot via the accessor.
+    if not history:
+        print("No calculations in history.")
+    else:
+        for calc_item in history:
+            print(calc_item)  # Calls __str__ method of Calculation.
+
+def _clear_history(calc):
+    """Clears the calculation history."""
+    calc.clear_history()  # Drops retained history and pending notifications.
+    logging.info("History cleared.")  # Log the action.
+    print("History cleared.")
+
+# Dispatch table mapping command names to their handlers. A single dict
+# lookup replaces the linear chain of string comparisons per input line.
+COMMANDS = {
+    "help": _print_help,
+    "list": _print_history,
+    "clear": _clear_history,
+}
+
+# Compiled once at import: a command word, optionally followed by exactly two
+# numbers. One match call classifies the whole line up front, so malformed
+# input is a cheap failed match instead of an exception raised and caught
+# inside the loop, and each operand is converted with float() exactly once.
+_INPUT_RE = re.compile(
+    r"^\s*(\w+)"
+    r"(?:\s+(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?))?\s*$"
+)
+
+def _iter_input(prompt):
+    """
+    Yields input lines read directly from sys.stdin, stopping at EOF.
+    Avoids input(), which unconditionally flushes stdout and stderr on
+    every call; here stdout is flushed only when a prompt is written,
+    which makes piped/scripted use of the REPL much cheaper per line.
+    """
+    stdin, stdout = sys.stdin, sys.stdout
+    while True:
+        if prompt:
+            stdout.write(prompt)
+            stdout.flush()  # Only flush when there is a prompt to show.
+        line = stdin.readline()
+        if not line:  # An empty read means EOF; end the REPL cleanly.
+            return
+        yield line.rstrip('\n')
+
 def calculator():
     """
     Interactive REPL (Read-Eval-Print Loop) for performing calculator operations.
     Provides a command-line interface for users to interact with the calculator.
     """
-    import pdb  # Import pdb module for debugging.
+    # Deferred imports: the operations stack is only paid for on first call,
+    # not when this module is imported (see the note at the top of the file).
+    from app.calculator.calculator_observer import CalculatorWithObserver
+    from app.history import HistoryObserver
+    from app.operations.operation_factory import OperationFactory
+    from app.operations.template_operation import flush_log_results
 
     # Create an instance of the calculator with observer support.
     calc = CalculatorWithObserver()
@@ -47,71 +114,64 @@ def calculator():
     # Display a welcome message and instructions.
     print("Welcome to the OOP Calculator! Type 'help' for available commands.")
 
-    # Start the REPL loop.
-    while True:
-        # Prompt the user for input.
-        user_input = input("Enter an operation and two numbers, or a command: ")
-
-        # Handle the 'help' command.
-        if user_input.lower() == "help":
-            print("\nAvailable commands:")
-            print("  add <num1> <num2>       : Add two numbers.")
-            print("  subtract <num1> <num2>  : Subtract the second number from the first.")
-            print("  multiply <num1> <num2>  : Multiply two numbers.")
-            print("  divide <num1> <num2>    : Divide the first number by the second.")
-            print("  list                    : Show the calculation history.")
-            print("  clear                   : Clear the calculation history.")
-            print("  exit                    : Exit the calculator.\n")
-            continue  # Return to the start of the loop.
+    # Start the REPL loop, reading lines straight from stdin.
+    for user_input in _iter_input("Enter an operation and two numbers, or a command: "):
+        if not user_input or user_input.isspace():
+            continue  # Ignore blank lines.
+
+        # One precompiled match classifies the whole line: group 1 is the
+        # command/operation word, groups 2 and 3 are the operands when present.
+        match = _INPUT_RE.match(user_input)
+        if match is None:
+            # Malformed line (non-numeric operands, wrong arity, ...).
+            logging.error("Invalid input or error: %r", user_input)  # Log the error.
+            print("Invalid input. Please enter a valid operation and two numbers. Type 'help' for instructions.")
+            continue
 
-        # Handle the 'exit' command.
-        if user_input.lower() == "exit":
+        operation_str, num1_str, num2_str = match.groups()
+        command = operation_str.lower()
+
+        # Handle the 'exit' command; it is the only one that ends the loop.
+        if command == "exit":
             print("Exiting calculator...")
             break  # Exit the loop and end the program.
 
-        # Handle the 'list' command to display calculation history.
-        if user_input.lower() == "list":
-            if not calc._history:
-                print("No calculations in history.")
-            else:
-                for calc_item in calc._history:
-                    print(calc_item)  # Calls __str__ method of Calculation.
-            continue  # Return to the start of the loop.
-
-        # Handle the 'clear' command to clear the history.
-        if user_input.lower() == "clear":
-            calc._history.clear()  # Clear the history list.
-            logging.info("History cleared.")  # Log the action.
-            print("History cleared.")
+        # Dispatch 'help'/'list'/'clear' through the command table.
+        handler = COMMANDS.get(command)
+        if handler:
+            handler(calc)  # Run the command against the calculator.
             continue  # Return to the start of the loop.
 
-        # Attempt to parse and execute the user's command.
-        try:
-            # Set a breakpoint for debugging.
-            # pdb.set_trace()  # Execution will pause here, allowing inspection of variables.
-
-            # Split the user input into components.
-            operation_str, num1_str, num2_str = user_input.split()  # May raise ValueError.
+        if num1_str is None:
+            # A lone word that is not a command: operands are missing.
+            logging.error("Invalid input or error: %r", user_input)  # Log the error.
+            print("Invalid input. Please enter a valid operation and two numbers. Type 'help' for instructions.")
+            continue
 
-            # Convert the operand strings to float.
-            num1, num2 = float(num1_str), float(num2_str)  # May raise ValueError.
+        # The regex has already vetted the operands; each converts exactly once.
+        num1, num2 = float(num1_str), float(num2_str)
 
-            # Use the factory to create the appropriate operation object.
-            operation = OperationFactory.create_operation(operation_str)
+        # Use the factory to create the appropriate operation object.
+        operation = OperationFactory.create_operation(command)
 
-            if operation:
+        if operation:
+            try:
                 # Perform the operation using the calculator.
                 result = calc.perform_operation(operation, num1, num2)
-                # Display the result to the user.
-                print(f"Result: {result}")
-            else:
-                # Handle unknown operation names.
-                print(f"Unknown operation '{operation_str}'. Type 'help' for available commands.")
-
-        except ValueError as e:
-            # Handle errors such as incorrect input format or invalid numbers.
-            logging.error(f"Invalid input or error: {e}")  # Log the error.
-            print("Invalid input. Please enter a valid operation and two numbers. Type 'help' for instructions.")
+            except ValueError as e:
+                # Domain errors such as division by zero.
+                logging.error("Invalid input or error: %s", e)  # Log the error.
+                print("Invalid input. Please enter a valid operation and two numbers. Type 'help' for instructions.")
+                continue
+            # Display the result to the user.
+            print(f"Result: {result}")
+        else:
+            # Handle unknown operation names.
+            print(f"Unknown operation '{operation_str}'. Type 'help' for available commands.")
+
+    # Deliver any buffered observer notifications and result logs before returning.
+    calc.flush()
+    flush_log_results()
 
 # Why use a REPL?
 # - Provides an interactive way for users to execute commands and see immediate results.
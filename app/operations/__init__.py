@@ -1,45 +1,79 @@
 from app.operations.template_operation import TemplateOperation
 
-from app.history.logger import logging 
+import sys
+
+from app.history.logger import logging
+
+from app.operations import _jit  # JIT-compiled scalar kernels (plain Python without Numba).
 
 class Addition(TemplateOperation):
     """
     Class to represent the addition operation.
     Inherits from TemplateOperation.
     """
-    def execute(self, a: float, b: float) -> float:
-        """
-        Returns the sum of two numbers.
-        """
-        return a + b  # Perform addition.
+    __slots__ = ()  # Stateless singleton; see TemplateOperation.
+
+    # Precomputed display name; interned so comparisons are pointer checks.
+    op_name = sys.intern("addition")
+
+    # Batched evaluation bindings; the kernel is None without Numba.
+    _batch_op = "add"
+    _batch_kernel = _jit.add_many
+
+    # The kernel is already a frameless callable (operator.add or the Numba
+    # dispatcher); binding it as a staticmethod skips the method-wrapper
+    # frame a def execute(self, ...) would push around a single addition.
+    execute = staticmethod(_jit.add)
 
 class Subtraction(TemplateOperation):
     """
     Class to represent the subtraction operation.
     Inherits from TemplateOperation.
     """
-    def execute(self, a: float, b: float) -> float:
-        """
-        Returns the difference between two numbers.
-        """
-        return a - b  # Perform subtraction.
+    __slots__ = ()  # Stateless singleton; see TemplateOperation.
+
+    # Precomputed display name; interned so comparisons are pointer checks.
+    op_name = sys.intern("subtraction")
+
+    # Batched evaluation bindings; the kernel is None without Numba.
+    _batch_op = "subtract"
+    _batch_kernel = _jit.sub_many
+
+    # Frameless kernel bound directly; see Addition.
+    execute = staticmethod(_jit.sub)
 
 class Multiplication(TemplateOperation):
     """
     Class to represent the multiplication operation.
     Inherits from TemplateOperation.
     """
-    def execute(self, a: float, b: float) -> float:
-        """
-        Returns the product of two numbers.
-        """
-        return a * b  # Perform multiplication.
+    __slots__ = ()  # Stateless singleton; see TemplateOperation.
+
+    # Precomputed display name; interned so comparisons are pointer checks.
+    op_name = sys.intern("multiplication")
+
+    # Batched evaluation bindings; the kernel is None without Numba.
+    _batch_op = "multiply"
+    _batch_kernel = _jit.mul_many
+
+    # Frameless kernel bound directly; see Addition.
+    execute = staticmethod(_jit.mul)
 
 class Division(TemplateOperation):
     """
     Class to represent the division operation.
     Inherits from TemplateOperation.
     """
+    __slots__ = ()  # Stateless singleton; see TemplateOperation.
+
+    # Precomputed display name; interned so comparisons are pointer checks.
+    op_name = sys.intern("division")
+
+    # Batched evaluation bindings; the kernel is None without Numba.
+    _batch_op = "divide"
+    _batch_kernel = _jit.div_many
+
+    # Division keeps a real method: the zero check must run before the kernel.
     def execute(self, a: float, b: float) -> float:
         """
         Returns the quotient of two numbers.
@@ -48,7 +82,7 @@ class Division(TemplateOperation):
         if b == 0:
             logging.error("Attempted to divide by zero.")  # Log an error message.
             raise ValueError("Division by zero is not allowed.")  # Raise an exception.
-        return a / b  # Perform division.
+        return _jit.div(a, b)  # Perform division via the compiled kernel.
 
 # Why use the Template Method Pattern here?
 # - It defines the algorithm's skeleton in a method (`calculate`), deferring some steps (`execute`) to subclasses.
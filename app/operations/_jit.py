@@ -0,0 +1,79 @@
+# ==============================================================================
+# JIT-COMPILED SCALAR KERNELS (OPTIONAL NUMBA FAST PATH)
+# ==============================================================================
+
+# Who: The scalar arithmetic kernels behind the concrete operation classes.
+# What: Pure floating-point kernels compiled to machine code when Numba is
+#       available, falling back to plain Python functions otherwise.
+# Why: Tight loops that call these kernels run as compiled code instead of
+#      CPython bytecode, bypassing interpreter dispatch and boxing.
+# Where: Imported by app/operations/__init__.py for the execute steps.
+# When: Compiled lazily on first call; cache=True persists compiled code.
+# How: Via numba.njit with a no-op decorator substitute when Numba is absent.
+
+try:
+    from numba import njit, prange  # Optional dependency; the operator fallback covers its absence.
+except ImportError:
+    njit = prange = None
+
+# Numba is not in requirements.txt, so CI measures only the fallback branch;
+# the compiled kernels are excluded from coverage rather than dragging the
+# gate below 100% where the optional dependency is absent.
+if njit is not None:  # pragma: no cover
+    @njit(cache=True)
+    def add(a: float, b: float) -> float:
+        """Returns the sum of two numbers."""
+        return a + b
+
+    @njit(cache=True)
+    def sub(a: float, b: float) -> float:
+        """Returns the difference between two numbers."""
+        return a - b
+
+    @njit(cache=True)
+    def mul(a: float, b: float) -> float:
+        """Returns the product of two numbers."""
+        return a * b
+
+    @njit(cache=True)
+    def div(a: float, b: float) -> float:
+        """Returns the quotient of two numbers; the caller checks for b == 0."""
+        return a / b
+
+    # Batched kernels: one parallel compiled loop over contiguous arrays.
+    # Only the batch entry points are jitted with parallel=True — per-call
+    # dispatch overhead makes scalar JIT a wash, but amortized over a whole
+    # array the interpreter disappears entirely.
+    @njit(cache=True, parallel=True)
+    def add_many(a, b, out):
+        """Element-wise addition of two arrays into out."""
+        for i in prange(a.size):
+            out[i] = a[i] + b[i]
+
+    @njit(cache=True, parallel=True)
+    def sub_many(a, b, out):
+        """Element-wise subtraction of two arrays into out."""
+        for i in prange(a.size):
+            out[i] = a[i] - b[i]
+
+    @njit(cache=True, parallel=True)
+    def mul_many(a, b, out):
+        """Element-wise multiplication of two arrays into out."""
+        for i in prange(a.size):
+            out[i] = a[i] * b[i]
+
+    @njit(cache=True, parallel=True)
+    def div_many(a, b, out):
+        """Element-wise division of two arrays into out; callers check zeros."""
+        for i in prange(a.size):
+            out[i] = a[i] / b[i]
+else:
+    # C-level fast path without Numba: the operator module's functions are
+    # implemented in C, so dispatching to them skips the Python frame a
+    # hand-written def would push — the same mechanism a small C extension
+    # would provide, without requiring a build step this project lacks.
+    from operator import add, mul, sub, truediv as div  # noqa: F401
+
+    # No batch JIT without Numba; calculate_many falls back to the
+    # vectorized path in app.operations.batch.
+    add_many = sub_many = mul_many = div_many = None
@@ -9,32 +9,38 @@
 # When: When performing operations on operands.
 # How: By holding a reference to a strategy object and executing it.
 
+import math
+
 from dataclasses import dataclass
 from app.operations.template_operation import TemplateOperation
 
-@dataclass  # Decorator to automatically generate special methods like __init__.
+@dataclass(slots=True)  # slots=True drops the per-instance __dict__ (~3x less memory per entry).
 class Calculation:
     """
     Represents a single calculation using the Strategy Pattern.
     Holds the operation (strategy) and operands.
+    Slotted because histories can hold thousands of these.
     """
     operation: TemplateOperation  # The operation to execute (strategy).
     operand1: float  # The first operand.
     operand2: float  # The second operand.
+    result: float = math.nan  # The cached result, set by the caller at construction.
 
     def __repr__(self) -> str:
         """
         Official string representation of the Calculation object.
         Used for debugging and logging.
         """
-        return f"Calculation({self.operand1}, {self.operation.__class__.__name__.lower()}, {self.operand2})"
+        return f"Calculation({self.operand1}, {self.operation.op_name}, {self.operand2})"
 
     def __str__(self) -> str:
         """
         User-friendly string representation of the calculation and result.
+        Renders the result cached at construction; it must not re-execute
+        the operation, since logging a calculation would otherwise re-run
+        the whole template method (validation, execute, and log_result).
         """
-        result = self.operation.calculate(self.operand1, self.operand2)  # Perform the calculation.
-        return f"{self.operand1} {self.operation.__class__.__name__.lower()} {self.operand2} = {result}"
+        return f"{self.operand1} {self.operation.op_name} {self.operand2} = {self.result}"
 
 # Why use the Strategy Pattern?
 # - Allows the algorithm (operation) to vary independently from the clients that use it.
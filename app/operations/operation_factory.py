@@ -9,10 +9,27 @@
 # When: At runtime, during the calculator's execution.
 # How: By mapping operation names to their corresponding classes.
 
+from types import MappingProxyType  # Read-only view over the dispatch map.
+
 from app.operations import Addition, Division, Multiplication, Subtraction
 from app.operations.template_operation import TemplateOperation
 from app.history.logger import logging
 
+# Module-level logger with %-style deferred formatting; see calculator_observer.
+log = logging.getLogger(__name__)
+
+# Dictionary mapping operation names to shared operation instances.
+# TemplateOperation subclasses are stateless, so one instance of each can be
+# built at import time and handed out on every lookup instead of allocating
+# four new objects per call. The MappingProxyType wrapper keeps the shared
+# map read-only so no caller can swap an entry out from under the others.
+_OPERATIONS = MappingProxyType({
+    "add": Addition(),
+    "subtract": Subtraction(),
+    "multiply": Multiplication(),
+    "divide": Division(),
+})
+
 class OperationFactory:
     """
     Factory class to create instances of operations based on the operation type.
@@ -25,17 +42,11 @@ class OperationFactory:
         Parameters:
         - operation (str): The operation name (e.g., 'add', 'subtract').
         """
-        # Dictionary mapping operation names to their corresponding class instances.
-        operations_map = {
-            "add": Addition(),
-            "subtract": Subtraction(),
-            "multiply": Multiplication(),
-            "divide": Division(),
-        }
         # Log the operation creation request at DEBUG level.
-        logging.debug(f"Creating operation for: {operation}")
-        # Retrieve the operation instance from the map.
-        return operations_map.get(operation.lower())  # Returns None if the key is not found.
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Creating operation for: %s", operation)
+        # Retrieve the shared operation instance from the module-level map.
+        return _OPERATIONS.get(operation.lower())  # Returns None if the key is not found.
 
 # Why use the Factory Pattern?
 # - It provides a way to create objects without specifying the exact class.
@@ -1,7 +1,58 @@
+import atexit  # To drain buffered result logs when the interpreter exits.
+import functools  # For caching specialized kernels per (class, operand types).
+import sys  # For interning the derived operation names.
+from collections import deque  # Bounded buffer for result log records.
+
 from app.history.logger import logging
+from app.operations.batch import perform_batch
+
+# Module-level logger used for cheap isEnabledFor checks in the fast path.
+log = logging.getLogger(__name__)
+
+# Numeric type constants built once at import time. The frozenset catches the
+# exact int/float case with a single hash lookup per operand; anything else
+# is validated by attempting the arithmetic itself (see validate_inputs).
+_NUMERIC_TYPES = (int, float)
+_NUMERIC_SET = frozenset(_NUMERIC_TYPES)
+
+class _LogBuffer:
+    """
+    Bounded in-memory buffer for log_result records.
+    Each operation appends a small (a, b, result) tuple; the buffer drains
+    as one joined INFO record when full, at interpreter exit, or when the
+    REPL flushes explicitly. This trades per-operation handler/lock/I-O
+    work for one logging call per flush.
+    """
+    __slots__ = ('_records',)
+
+    def __init__(self, capacity: int = 512):
+        self._records = deque(maxlen=capacity)  # Oldest entries drop if never flushed.
+
+    def append(self, a, b, result):
+        """Buffers one result record, flushing when the buffer fills."""
+        self._records.append((a, b, result))
+        if len(self._records) == self._records.maxlen:
+            self.flush()
+
+    def flush(self):
+        """Drains all buffered records as a single INFO log record."""
+        if not self._records:
+            return
+        lines = "\n".join(
+            f"Operation performed: {a} and {b} -> Result: {r}"
+            for a, b, r in self._records
+        )
+        self._records.clear()
+        log.info("%s", lines)
+
+_result_buffer = _LogBuffer()
+
+def flush_log_results():
+    """Flushes the shared buffer of operation result logs."""
+    _result_buffer.flush()
 
-from abc import ABC, abstractmethod  # For creating abstract base classes (ABCs).
-# Documentation: https://docs.python.org/3/library/abc.html
+# Drain anything still buffered when the interpreter exits.
+atexit.register(flush_log_results)
 
 # ==============================================================================
 # OPERATION CLASSES (COMMAND AND TEMPLATE METHOD PATTERNS)
@@ -18,47 +69,268 @@ from abc import ABC, abstractmethod  # For creating abstract base classes (ABCs)
 # is encapsulated as an object. The Template Method Pattern is used to define the
 # skeleton of an algorithm, deferring some steps to subclasses.
 
-class TemplateOperation(ABC):
+class TemplateOperation:
     """
-    Abstract base class representing a mathematical operation using the Template Method pattern.
-    - Inherits from ABC to make it an abstract base class.
+    Base class representing a mathematical operation using the Template Method pattern.
+    - A plain (duck-typed) base: ABCMeta would tax every isinstance check and
+      instantiation, so execute simply raises NotImplementedError instead.
     - The Template Method Pattern defines the steps of an algorithm.
     """
+    __slots__ = ()  # Operations are stateless; no per-instance __dict__ or __weakref__.
+
+    # Whether calculate results may be served from the memo table. Leave off
+    # for operations whose execute is cheaper than a cache probe; expensive
+    # future operations (power, root, ...) should set this to True.
+    _memoize = False
+
+    _instance = None  # Per-subclass cached singleton instance.
+
+    def __new__(cls):
+        """
+        Overrides __new__ so each operation class is a singleton, as
+        SingletonCalculator already is. Operations are stateless, so the
+        factory and any direct constructor calls can share one instance
+        per class instead of allocating a fresh object every time.
+        """
+        # Look only in the class's own dict: a plain attribute read would
+        # inherit a parent class's instance and hand it to the subclass.
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Binds a specialized calculate to each concrete subclass at class
+        creation. The generated function closes over the subclass's execute,
+        removing the per-call self.execute lookup and one level of method
+        dispatch while keeping the template's exact semantics (TypeError
+        translated to ValueError, log_result gated on INFO).
+        Subclasses that define their own calculate are left untouched.
+        """
+        super().__init_subclass__(**kwargs)
+        # Derive the display name once per class unless the subclass set
+        # its own; repr/str then read a plain attribute instead of walking
+        # __class__.__name__ and lowering it per call.
+        if 'op_name' not in cls.__dict__:
+            cls.op_name = sys.intern(cls.__name__.lower())
+        if 'calculate' in cls.__dict__:
+            return  # Respect an explicit override.
+        execute = cls.__dict__.get('execute')
+        if execute is None:
+            return  # Nothing concrete to specialize against.
+        cls.calculate = _build_specialized_calculate(cls, execute)
+
     def calculate(self, a: float, b: float) -> float:
         """
         Template method that defines the structure for performing an operation.
         Steps:
-        1. Validate inputs.
-        2. Execute the operation.
-        3. Log the result.
+        1. Validate the operands; exact int/float pass on two set lookups,
+           anything else goes through the duck-typed probe. The guard must
+           run before execute: some operators accept non-numbers (str + str,
+           str * int) and would otherwise return garbage instead of raising.
+        2. Execute the operation; duck-typed operands whose probe passed but
+           whose operator still raises TypeError get the same ValueError.
+        3. Log the result when INFO logging is enabled.
         """
-        self.validate_inputs(a, b)  # Step 1: Validate the inputs.
-        result = self.execute(a, b)  # Step 2: Perform the specific operation.
-        self.log_result(a, b, result)  # Step 3: Log the operation and the result.
+        if type(a) not in _NUMERIC_SET or type(b) not in _NUMERIC_SET:
+            self.validate_inputs(a, b)  # Step 1: Reject non-numeric operands.
+        try:
+            if self._memoize and _cacheable(a, b):
+                result = _memo_execute(type(self), a, b)  # Step 2 via the memo table.
+            else:
+                result = self.execute(a, b)  # Step 2: Perform the specific operation.
+        except TypeError:
+            log.error("Invalid input: %s, %s (Inputs must be numbers)", a, b)  # Log an error message.
+            raise ValueError("Both inputs must be numbers.") from None  # Raise an exception.
+        if log.isEnabledFor(logging.INFO):
+            self.log_result(a, b, result)  # Step 3: Log the operation and the result.
         return result  # Return the result of the operation.
 
     def validate_inputs(self, a: float, b: float):
         """
-        Common validation method to ensure inputs are numbers.
+        Strict up-front validation that inputs are numbers, kept as an
+        opt-in slow path for callers that want to check before executing.
         Raises a ValueError if inputs are not numeric types.
         """
-        if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
-            logging.error(f"Invalid input: {a}, {b} (Inputs must be numbers)")  # Log an error message.
-            raise ValueError("Both inputs must be numbers.")  # Raise an exception.
+        # Fast path: exact int/float types, one set lookup each.
+        if type(a) in _NUMERIC_SET and type(b) in _NUMERIC_SET:
+            return
+        # EAFP fallback: the arithmetic itself is the validation. Anything
+        # that can be added to a float counts as numeric (duck typing),
+        # and the try/except costs nothing when the probe succeeds.
+        try:
+            a + 0.0
+            b + 0.0
+        except TypeError:
+            log.error("Invalid input: %s, %s (Inputs must be numbers)", a, b)  # Log an error message.
+            raise ValueError("Both inputs must be numbers.") from None  # Raise an exception.
 
-    @abstractmethod
     def execute(self, a: float, b: float) -> float:
         """
-        Abstract method to perform the specific operation.
+        Performs the specific operation.
         Must be implemented by subclasses.
         """
-        pass  # pragma: no cover
+        raise NotImplementedError("Subclasses must implement execute().")  # pragma: no cover
 
     def log_result(self, a: float, b: float, result: float):
         """
-        Logs the result of the calculation.
+        Records the result of the calculation in the shared log buffer.
+        The isEnabledFor guard means a disabled INFO level costs nothing;
+        buffered records are emitted in bulk (see _LogBuffer).
         """
-        logging.info(f"Operation performed: {a} and {b} -> Result: {result}")  # Log an informational message.
+        if log.isEnabledFor(logging.INFO):
+            _result_buffer.append(a, b, result)  # Buffered; flushed in bulk.
+
+    # Batched evaluation hooks, bound by concrete subclasses: the key into
+    # the batch dispatch tables and the optional parallel Numba kernel.
+    _batch_op = None
+    _batch_kernel = None
+
+    @classmethod
+    def calculate_many(cls, a, b):
+        """
+        Evaluates this operation over whole operand sequences in one call.
+        Runs the parallel Numba kernel when one is compiled; otherwise the
+        batch goes through app.operations.batch (NumPy ufuncs or the plain
+        fallback). Either way the per-element interpreter dispatch of the
+        scalar calculate disappears.
+        """
+        if cls._batch_op is None:
+            raise NotImplementedError("This operation has no batched form.")
+        kernel = cls._batch_kernel
+        # Kernels only exist where Numba is installed, which CI is not; the
+        # block is excluded from coverage (see _jit.py).
+        if kernel is not None:  # pragma: no cover
+            import numpy as np  # Numba guarantees NumPy is importable.
+            a_arr = np.asarray(a, dtype=np.float64)
+            b_arr = np.asarray(b, dtype=np.float64)
+            if cls._batch_op == "divide" and (b_arr == 0).any():
+                log.error("Attempted to divide by zero in a batch.")
+                raise ValueError("Division by zero is not allowed.")
+            out = np.empty_like(a_arr)
+            kernel(a_arr, b_arr, out)
+            return out
+        return perform_batch(cls._batch_op, a, b)
+
+    @classmethod
+    def specialize(cls, a_type: type, b_type: type):
+        """
+        Returns a kernel specialized for the given operand types.
+        For known-numeric types the kernel skips validate_inputs (isinstance
+        can never fail for int/float) and only calls log_result when INFO
+        logging is enabled; otherwise the full template method is returned.
+        Kernels are cached per (class, operand types).
+        """
+        return _specialized_kernel(cls, a_type, b_type)
+
+# Direct-mapped write-back memo table for operations that opt in via the
+# _memoize class flag. 512 fixed slots, each holding one (key, value) pair;
+# a colliding key simply overwrites the slot, so memory stays constant and
+# there is no LRU bookkeeping. Trivially cheap operations (add, subtract,
+# ...) leave _memoize off: for them a cache probe costs more than the
+# arithmetic it would save, and their keys would only pollute the table.
+_MEMO_SIZE = 512
+_MEMO_SLOTS = [None] * _MEMO_SIZE
+
+def _memo_execute(op_cls, a, b):
+    """
+    Executes via the direct-mapped memo table.
+    Keys are (operation class, operands); operations are pure functions of
+    their operands, so a hit is always safe to reuse.
+    """
+    key = (op_cls, a, b)
+    index = hash(key) % _MEMO_SIZE
+    entry = _MEMO_SLOTS[index]
+    if entry is not None and entry[0] == key:
+        return entry[1]  # Hit: one hash, one compare, no execution.
+    result = op_cls().execute(a, b)
+    _MEMO_SLOTS[index] = (key, result)  # Write back, evicting any collider.
+    return result
+
+def _cacheable(a, b) -> bool:
+    """True when the operands are exact numerics safe to use as cache keys."""
+    # NaN compares unequal to itself and would never hit its own entry.
+    return type(a) in _NUMERIC_SET and type(b) in _NUMERIC_SET and a == a and b == b
+
+def _build_specialized_calculate(cls, execute):
+    """
+    Builds the specialized calculate bound to one concrete subclass.
+    The closure captures the subclass's execute directly (unwrapping
+    staticmethods so C-level callables are invoked without a frame),
+    which is the partial-evaluation step: by the time calculate runs,
+    the operation to perform is already resolved. Each variant keeps the
+    template's full semantics: the numeric guard runs before execute
+    (some operators accept strings and would return garbage), TypeError
+    becomes ValueError, and log_result stays gated on INFO.
+    """
+    memoize = getattr(cls, '_memoize', False)  # Captured once at class creation.
+    if isinstance(execute, staticmethod):
+        kernel = execute.__func__  # Call the underlying function directly.
+
+        def calculate(self, a: float, b: float) -> float:
+            """Specialized template method; see TemplateOperation.calculate."""
+            if type(a) not in _NUMERIC_SET or type(b) not in _NUMERIC_SET:
+                self.validate_inputs(a, b)  # Reject non-numeric operands up front.
+            try:
+                result = _memo_execute(cls, a, b) if memoize and _cacheable(a, b) else kernel(a, b)
+            except TypeError:
+                log.error("Invalid input: %s, %s (Inputs must be numbers)", a, b)
+                raise ValueError("Both inputs must be numbers.") from None
+            if log.isEnabledFor(logging.INFO):
+                self.log_result(a, b, result)
+            return result
+    else:
+        def calculate(self, a: float, b: float) -> float:
+            """Specialized template method; see TemplateOperation.calculate."""
+            if type(a) not in _NUMERIC_SET or type(b) not in _NUMERIC_SET:
+                self.validate_inputs(a, b)  # Reject non-numeric operands up front.
+            try:
+                result = _memo_execute(cls, a, b) if memoize and _cacheable(a, b) else execute(self, a, b)
+            except TypeError:
+                log.error("Invalid input: %s, %s (Inputs must be numbers)", a, b)
+                raise ValueError("Both inputs must be numbers.") from None
+            if log.isEnabledFor(logging.INFO):
+                self.log_result(a, b, result)
+            return result
+
+    calculate.__qualname__ = f"{cls.__qualname__}.calculate"
+    return calculate
+
+@functools.lru_cache(maxsize=None)
+def _specialized_kernel(op_cls, a_type, b_type):
+    """
+    Builds (and caches) the specialized kernel for one (class, types) triple.
+    The returned callable takes (operation, a, b) like an unbound method.
+    """
+    if a_type in (int, float) and b_type in (int, float):
+        log_result = op_cls.log_result
+        # Find the defining class's raw execute: a staticmethod unwraps to a
+        # two-argument callable, while a plain function still expects self.
+        raw = next(
+            klass.__dict__['execute']
+            for klass in op_cls.__mro__ if 'execute' in klass.__dict__
+        )
+        if isinstance(raw, staticmethod):
+            execute = raw.__func__
+
+            def kernel(operation, a, b):
+                result = execute(a, b)  # Validation is statically satisfied.
+                if log.isEnabledFor(logging.INFO):
+                    log_result(operation, a, b, result)  # Keep the INFO trail when enabled.
+                return result
+        else:
+            execute = op_cls.execute
+
+            def kernel(operation, a, b):
+                result = execute(operation, a, b)  # Validation is statically satisfied.
+                if log.isEnabledFor(logging.INFO):
+                    log_result(operation, a, b, result)  # Keep the INFO trail when enabled.
+                return result
+
+        return kernel
+    return op_cls.calculate  # Unknown types take the full template method.
 
 # Concrete operation classes implementing specific arithmetic operations.
 # Each class represents a specific operation and extends the TemplateOperation base class.
\ No newline at end of file
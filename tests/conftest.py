@@ -1,17 +1,21 @@
 """Configuration file for pytest fixtures."""
 
+import sys
 from io import StringIO
-from unittest.mock import patch
 import pytest
 from app.main import calculator
 
 @pytest.fixture
-def calculator_input_output():
+def calculator_input_output(capsys, monkeypatch):
     """Fixture to capture calculator input and output."""
     def _calculator_input_output(user_input):
-        with patch("builtins.input", side_effect=[user_input, "exit"]), \
-             patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            calculator()  # Call the calculator function
-        return mock_stdout.getvalue()  # Capture the output
+        # The REPL reads lines from sys.stdin directly, so swap in a
+        # pre-built stream. monkeypatch restores it at teardown without
+        # mock's _patch object creation and descriptor bookkeeping.
+        # Output is captured by pytest's capsys, whose C-level stream
+        # redirect is much cheaper than patching sys.stdout by hand.
+        monkeypatch.setattr(sys, "stdin", StringIO(f"{user_input}\nexit\n"))
+        calculator()  # Call the calculator function
+        return capsys.readouterr().out  # Capture the output
 
     return _calculator_input_output
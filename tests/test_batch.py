@@ -0,0 +1,46 @@
+"""Unit tests for the batched operations API."""
+
+import pytest
+from app.calculator.calculator_observer import CalculatorWithObserver
+from app.operations.batch import perform_batch
+
+@pytest.mark.parametrize("operation, a, b, expected", [
+    ("add", [1, 2, 3], [4, 5, 6], [5.0, 7.0, 9.0]),
+    ("subtract", [10, 8], [4, 3], [6.0, 5.0]),
+    ("multiply", [2, 3], [3, 4], [6.0, 12.0]),
+    ("divide", [10, 9], [2, 3], [5.0, 3.0]),
+])
+def test_perform_batch_valid(operation, a, b, expected):
+    """Test element-wise results for each supported operation."""
+    results = perform_batch(operation, a, b)
+    assert list(results) == expected
+
+def test_perform_batch_divide_by_zero():
+    """Test that a zero divisor anywhere in the batch raises ValueError."""
+    with pytest.raises(ValueError):
+        perform_batch("divide", [1, 2], [1, 0])
+
+def test_perform_batch_unknown_operation():
+    """Test that an unknown operation name raises ValueError."""
+    with pytest.raises(ValueError):
+        perform_batch("modulo", [1], [2])
+
+def test_calculate_many_matches_scalar_results():
+    """Test that the classmethod batch entry point matches scalar results."""
+    from app.operations import Multiplication
+    results = Multiplication.calculate_many([2, 3], [5, 7])
+    assert list(results) == [10.0, 21.0]
+
+def test_calculate_many_without_batch_binding():
+    """Test that an operation with no batched form raises NotImplementedError."""
+    from app.operations.template_operation import TemplateOperation
+    with pytest.raises(NotImplementedError):
+        TemplateOperation.calculate_many([1], [2])
+
+def test_calculator_perform_batch_records_one_summary():
+    """Test that a batch adds one history entry and notifies once."""
+    calc = CalculatorWithObserver()
+    results = calc.perform_batch("add", [1, 2, 3], [1, 1, 1])
+    assert list(results) == [2.0, 3.0, 4.0]
+    assert len(calc._history) == 1, "A batch should record a single summary."
+    assert "add batch of 3 pairs" in str(calc._history[0])
@@ -0,0 +1,19 @@
+"""Unit tests for the OperationFactory."""
+
+import logging
+
+from app.operations import Addition
+from app.operations.operation_factory import OperationFactory
+
+def test_create_operation_returns_shared_instance(caplog):
+    """Test that the factory hands out the shared singleton instance."""
+    caplog.set_level(logging.DEBUG)  # Creation requests are logged at DEBUG.
+    operation = OperationFactory.create_operation("add")
+    assert isinstance(operation, Addition)
+    # Lookups are case-insensitive and always yield the same instance.
+    assert operation is OperationFactory.create_operation("ADD")
+    assert "Creating operation for: add" in caplog.text
+
+def test_create_operation_unknown_returns_none():
+    """Test that an unknown operation name yields None."""
+    assert OperationFactory.create_operation("modulo") is None
@@ -0,0 +1,52 @@
+"""Unit tests for the buffered log file handler."""
+
+import logging
+
+import pytest
+from app.history.logger import LOG_FORMAT, BufferedFileHandler
+
+@pytest.fixture
+def handler(tmp_path):
+    """A BufferedFileHandler writing to a throwaway file."""
+    file_handler = BufferedFileHandler(str(tmp_path / "test.log"))
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    yield file_handler
+    file_handler.close()
+
+def _record(level, msg, args=None):
+    """Builds a bare LogRecord at the given level."""
+    return logging.LogRecord("test", level, __file__, 0, msg, args, None)
+
+def _read(handler):
+    """Returns what has actually reached the handler's file on disk."""
+    with open(handler.baseFilename, encoding="utf-8") as log_file:
+        return log_file.read()
+
+def test_warning_records_flush_immediately(handler):
+    """Test that WARNING and above reach the file without an explicit flush."""
+    handler.emit(_record(logging.WARNING, "something went wrong"))
+    assert "something went wrong" in _read(handler)
+
+def test_info_records_stay_buffered(handler):
+    """Test that records below WARNING wait in the buffer until a flush."""
+    handler.emit(_record(logging.INFO, "routine detail"))
+    assert _read(handler) == "", "INFO should sit in the 64 KiB buffer."
+    handler.flush()
+    assert "routine detail" in _read(handler)
+
+def test_emit_reopens_a_closed_stream(handler):
+    """Test that emit lazily reopens the stream after a close."""
+    handler.close()  # Drops the stream; the next emit must reopen it.
+    handler.emit(_record(logging.WARNING, "reopened"))
+    assert "reopened" in _read(handler)
+
+def test_flush_tolerates_a_closed_stream(handler):
+    """Test that flushing with no open stream is a harmless no-op."""
+    handler.close()
+    handler.flush()  # Must not raise.
+
+def test_emit_routes_format_errors_to_handle_error(handler, monkeypatch):
+    """Test that a failing format goes through handleError, not the caller."""
+    monkeypatch.setattr(logging, "raiseExceptions", False)  # Keep stderr quiet.
+    handler.emit(_record(logging.WARNING, "%d", ("not a number",)))
+    assert _read(handler) == "", "A record that fails to format writes nothing."
@@ -1,22 +1,65 @@
 """Unit tests for the calculator operations."""
 
+import contextlib
+import sys
+from io import StringIO
+
 import pytest
+from app.main import calculator
 from app.operations.calculation import Calculation
 from app.operations.operation_factory import OperationFactory  # Assuming you have this factory
 
+# Every line the shared REPL session feeds, in order. 'list' runs before any
+# operation so the empty-history notice is observable; 'clear' runs last so
+# its confirmation does not hide earlier history output. Error inputs go
+# through the per-test calculator_input_output fixture instead, so each
+# failure message is attributable to the input that caused it.
+SESSION_INPUTS = [
+    "help",
+    "list",
+    "add 5 3",
+    "subtract 10 4",
+    "multiply 2 3",
+    "divide 10 2",
+    "clear",
+    "exit",
+]
+
+# The REPL writes this prompt before reading each line, which makes it a
+# reliable delimiter for carving the transcript into per-input segments.
+_PROMPT = "Enter an operation and two numbers, or a command: "
+
+@pytest.fixture(scope="module")
+def full_session_output():
+    """Runs one calculator() REPL session over all test inputs and returns a
+    mapping from each input line to the output it produced. One module-scoped
+    session replaces a REPL startup and teardown per parametrized case, and
+    splitting on the prompt attributes every line of output to the input that
+    caused it. capsys is function-scoped, so stdout is redirected directly."""
+    stdin = sys.stdin
+    sys.stdin = StringIO("\n".join(SESSION_INPUTS) + "\n")
+    buffer = StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            calculator()  # One REPL pass over every scripted input line.
+    finally:
+        sys.stdin = stdin
+    # segments[0] is the welcome banner; each later segment follows one prompt
+    # and therefore holds exactly the output of the corresponding input.
+    segments = buffer.getvalue().split(_PROMPT)
+    return dict(zip(SESSION_INPUTS, segments[1:]))
+
 @pytest.mark.parametrize("operation_str, num1, num2, expected_result", [
     ("add", 5, 3, 8.0),          # Valid addition
     ("subtract", 10, 4, 6.0),    # Valid subtraction
     ("multiply", 2, 3, 6.0),     # Valid multiplication
     ("divide", 10, 2, 5.0),      # Valid division
 ])
-def test_valid_operations(operation_str, num1, num2, expected_result, calculator_input_output):
+def test_valid_operations(operation_str, num1, num2, expected_result, full_session_output):
     """Test valid calculator operations."""
-    user_input = f"{operation_str} {num1} {num2}"
-    output = calculator_input_output(user_input)  # Use the fixture to call calculator
-
-    # Check the output
-    assert f"Result: {expected_result}" in output
+    # Check the output segment belonging to exactly this input line.
+    segment = full_session_output[f"{operation_str} {num1} {num2}"]
+    assert f"Result: {expected_result}" in segment
 
     # Test __repr__ coverage for Calculation class
     operation = OperationFactory.create_operation(operation_str)  # Fixed method call
@@ -27,30 +70,33 @@ def test_valid_operations(operation_str, num1, num2, expected_result, calculator
         f"Calculation({num1}, {operation.__class__.__name__.lower()}, {num2})"
     )
 
-@pytest.mark.parametrize("operation_str, num1, num2", [
-    ("divide", 10, 0),          # Division by zero
-    ("unknown", 1, 1),          # Unknown operation
+def test_calculation_str_renders_cached_result():
+    """Test that __str__ renders the result cached at construction."""
+    operation = OperationFactory.create_operation("add")
+    calculation = Calculation(operation, 2, 3, 5.0)
+    assert str(calculation) == "2 addition 3 = 5.0"
+
+@pytest.mark.parametrize("user_input, expected_output", [
+    # Division by zero
+    ("divide 10 0", "Invalid input. Please enter a valid operation and two numbers."),
+    # Unknown operation
+    ("unknown 1 1", "Unknown operation 'unknown'."),
 ])
-def test_invalid_operations(operation_str, num1, num2, calculator_input_output):
+def test_invalid_operations(user_input, expected_output, calculator_input_output):
     """Test invalid calculator operations."""
-    user_input = f"{operation_str} {num1} {num2}"
     output = calculator_input_output(user_input)  # Use the fixture to call calculator
 
-    # Check the output for unknown operation
-    if operation_str == "divide":
-        assert "Invalid input. Please enter a valid operation and two numbers." in output
-    else:
-        assert f"Unknown operation '{operation_str}'." in output
+    # Check the output for this specific failing input
+    assert expected_output in output
 
 @pytest.mark.parametrize("user_command, expected_output", [
     ("help", "Available commands:"),
     ("list", "No calculations in history."),
     ("clear", "History cleared."),
 ])
-def test_commands(user_command, expected_output, calculator_input_output):
+def test_commands(user_command, expected_output, full_session_output):
     """Test commands for the calculator."""
-    user_input = f"{user_command}"
-    output = calculator_input_output(user_input)  # Use the fixture to call calculator
+    segment = full_session_output[user_command]
 
-    # Check if the expected output is in the output
-    assert expected_output in output
+    # Check if the expected output is in this command's own segment
+    assert expected_output in segment
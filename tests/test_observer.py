@@ -0,0 +1,60 @@
+"""Unit tests for CalculatorWithObserver and HistoryObserver."""
+
+import logging
+
+import pytest
+from app.calculator.calculator_observer import CalculatorWithObserver
+from app.history import HistoryObserver
+from app.operations.operation_factory import OperationFactory
+
+@pytest.fixture
+def observed_calculator():
+    """A fresh observer calculator with one registered HistoryObserver."""
+    calc = CalculatorWithObserver()
+    calc.add_observer(HistoryObserver())
+    return calc
+
+def test_observer_update_logs_single_calculation(caplog):
+    """Test the single-calculation notification hook directly."""
+    caplog.set_level(logging.INFO)
+    observer = HistoryObserver()
+    operation = OperationFactory.create_operation("add")
+    observer.update(f"1 {operation.op_name} 2 = 3")
+    assert "Observer: New calculation added -> 1 addition 2 = 3" in caplog.text
+
+def test_notifications_flush_at_batch_threshold(caplog):
+    """Test that a full micro-batch is delivered without an explicit flush."""
+    caplog.set_level(logging.DEBUG)  # Also exercises the gated DEBUG trail.
+    calc = CalculatorWithObserver()
+    calc.add_observer(HistoryObserver())
+    operation = OperationFactory.create_operation("add")
+    for i in range(calc._batch_size):  # Exactly one batch worth of operations.
+        calc.perform_operation(operation, i, i)
+    assert calc._pending == [], "A full batch should deliver automatically."
+    assert f"Observer: batch of {calc._batch_size} calculations" in caplog.text
+
+def test_get_history_returns_snapshot(observed_calculator):
+    """Test that get_history materializes a copy of the ring buffer."""
+    operation = OperationFactory.create_operation("add")
+    observed_calculator.perform_operation(operation, 1, 2)
+    history = observed_calculator.get_history()
+    assert len(history) == 1
+    assert history[-1].result == 3
+    history.clear()  # Mutating the snapshot must not touch the calculator.
+    assert len(observed_calculator.get_history()) == 1
+    observed_calculator.flush()  # Deliver the pending entry quietly (no DEBUG).
+    assert observed_calculator._pending == []
+
+def test_clear_history_drops_pending_notifications(observed_calculator, caplog):
+    """Test that clearing discards undelivered notifications too."""
+    caplog.set_level(logging.INFO)
+    operation = OperationFactory.create_operation("multiply")
+    observed_calculator.perform_operation(operation, 3, 4)
+    assert observed_calculator._pending, "The calculation should await delivery."
+
+    observed_calculator.clear_history()
+    assert observed_calculator.get_history() == []
+    observed_calculator.flush()  # Nothing pending: observers hear nothing.
+    assert "Observer:" not in caplog.text, (
+        "Observers must not be notified about cleared calculations."
+    )
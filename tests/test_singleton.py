@@ -1,17 +1,21 @@
 # pylint: disable=redefined-outer-name
 """Unit tests for the SingletonCalculator."""
 
+import logging
+
 import pytest
 from app.operations.operation_factory import OperationFactory
 from app.calculator.calculator_singleton import SingletonCalculator
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='module')
 def singleton_calculator():
-    """Fixture to provide a SingletonCalculator instance."""
+    """Module-scoped fixture providing the shared SingletonCalculator.
+    The singleton persists across tests anyway, so one fixture setup (and
+    one clear) serves the whole module; tests assert on history deltas
+    rather than absolute lengths."""
     calc = SingletonCalculator()
+    calc.get_history().clear()  # Start the module from a clean slate.
     yield calc
-    # Clear history after each test
-    calc.get_history().clear()  # Clear the history using the main.py method
 
 @pytest.mark.parametrize("operation_str, a, b, expected_result", [
     ("add", 1, 2, 3),
@@ -22,36 +26,38 @@ def singleton_calculator():
 def test_perform_operation(singleton_calculator, operation_str, a, b, expected_result):
     """Test performing a calculation and checking if history is updated."""
     operation = OperationFactory.create_operation(operation_str)
+    start_len = len(singleton_calculator.get_history())  # Snapshot before the operation
     result = singleton_calculator.perform_operation(operation, a, b)  # Perform operation
     history = singleton_calculator.get_history()  # Retrieve history
 
     assert result == expected_result, (
         f"The result of {operation_str} should be {expected_result}."
     )
-    assert len(history) == 1, "History should contain one calculation."
+    assert len(history) - start_len == 1, "History should gain one calculation."
 
     # Ensure we compare the operation type correctly
     assert (
-        history[0].operation.__class__.__name__.lower() ==
+        history[-1].operation.__class__.__name__.lower() ==
         operation.__class__.__name__.lower()
     ), "History should contain the correct operation."
 
 def test_get_history(singleton_calculator):
     """Test getting the history of calculations."""
     operation = OperationFactory.create_operation('multiply')
+    start_len = len(singleton_calculator.get_history())  # Snapshot before the operation
     singleton_calculator.perform_operation(operation, 4, 2)  # Perform multiplication
     history = singleton_calculator.get_history()  # Retrieve history
 
-    assert len(history) == 1, (
-        "History should contain one calculation after performing an operation."
+    assert len(history) - start_len == 1, (
+        "History should gain one calculation after performing an operation."
     )
 
 def test_clear_history(singleton_calculator):
     """Test that the history can be cleared."""
     operation = OperationFactory.create_operation('divide')
     singleton_calculator.perform_operation(operation, 10, 2)  # Perform division
-    assert len(singleton_calculator.get_history()) == 1, (
-        "History should contain one calculation before clearing."
+    assert len(singleton_calculator.get_history()) >= 1, (
+        "History should contain at least one calculation before clearing."
     )
 
     # Simulate user input to clear history as per main.py logic
@@ -63,3 +69,53 @@ def test_clear_history(singleton_calculator):
     assert len(singleton_calculator.get_history()) == 0, (
         "History should be empty after clearing."
     )
+
+def test_singleton_returns_same_instance(singleton_calculator):
+    """Test that repeated construction yields the one shared instance."""
+    assert SingletonCalculator() is singleton_calculator
+
+def test_history_view_supports_slicing(singleton_calculator):
+    """Test that the history view reconstructs Calculations from slices."""
+    add_op = OperationFactory.create_operation('add')
+    mul_op = OperationFactory.create_operation('multiply')
+    singleton_calculator.get_history().clear()
+    singleton_calculator.perform_operation(add_op, 1, 2)
+    singleton_calculator.perform_operation(mul_op, 3, 4)
+    history = singleton_calculator.get_history()
+
+    assert [calc.result for calc in history[:2]] == [3.0, 12.0]
+    assert history[-1].operation is mul_op, "Negative indices behave like a list's."
+
+def test_history_results_column_matches_entries(singleton_calculator):
+    """Test that the contiguous result column mirrors the reconstructed entries."""
+    operation = OperationFactory.create_operation('add')
+    singleton_calculator.get_history().clear()
+    for i in range(3):
+        singleton_calculator.perform_operation(operation, i, i)
+    history = singleton_calculator.get_history()
+
+    assert list(history.results()) == [calc.result for calc in history]
+    assert sum(history.results()) == 6.0, "Aggregates read one flat buffer."
+
+def test_history_trims_oldest_entries_in_blocks(singleton_calculator, monkeypatch):
+    """Test that exceeding the capacity evicts the oldest block of rows."""
+    monkeypatch.setattr(SingletonCalculator, "HISTORY_CAPACITY", 8)
+    monkeypatch.setattr(SingletonCalculator, "_TRIM_CHUNK", 4)
+    operation = OperationFactory.create_operation('add')
+    singleton_calculator.get_history().clear()
+    for i in range(12):  # Capacity plus one full trim block.
+        singleton_calculator.perform_operation(operation, i, 1)
+    history = singleton_calculator.get_history()
+
+    assert len(history) == 8, "The trim should restore the configured capacity."
+    assert history[0].operand1 == 4.0, "The oldest block should be gone."
+
+def test_perform_operation_logs_at_debug(singleton_calculator, caplog):
+    """Test the DEBUG trail, which boxes a record only when it will render."""
+    caplog.set_level(logging.DEBUG)
+    operation = OperationFactory.create_operation('subtract')
+    singleton_calculator.perform_operation(operation, 9, 5)
+    assert (
+        "SingletonCalculator: Performed operation -> Calculation(9, subtraction, 5)"
+        in caplog.text
+    )
@@ -1,7 +1,17 @@
 """Unit tests for TemplateOperation and its concrete implementations."""
 
+import logging
+import math
+
 import pytest
-from app.operations.template_operation import TemplateOperation
+from app.operations import Addition, Multiplication
+from app.operations.template_operation import (
+    _MEMO_SIZE,
+    _MEMO_SLOTS,
+    _result_buffer,
+    TemplateOperation,
+    flush_log_results,
+)
 
 # Define a concrete subclass for testing purposes
 class ConcreteOperation(TemplateOperation):
@@ -11,25 +21,207 @@ class ConcreteOperation(TemplateOperation):
         """Perform addition on two numbers."""
         return a + b  # Simple implementation for testing
 
+# Opt-in memoizing subclass for exercising the direct-mapped memo table;
+# the shipped operations leave _memoize off because they are cheaper than
+# a cache probe.
+class MemoizedOperation(TemplateOperation):
+    """Memoizing implementation of TemplateOperation for testing purposes."""
+
+    _memoize = True
+    calls = 0  # Counts how often the real work actually runs.
+
+    def execute(self, a: float, b: float) -> float:
+        """Perform addition, counting each real execution."""
+        MemoizedOperation.calls += 1
+        return a + b
+
+# Subclass that opts out of specialization by restating the base template;
+# __init_subclass__ must leave an explicitly declared calculate untouched.
+class GenericOperation(TemplateOperation):
+    """Subclass keeping the generic template method for testing purposes."""
+
+    _memoize = True  # Route cacheable operands through the memo table.
+    calculate = TemplateOperation.calculate  # Explicit override: no specialization.
+
+    def execute(self, a: float, b: float) -> float:
+        """Perform subtraction on two numbers."""
+        return a - b
+
+def _reject(a, b):
+    """Stand-in for a C kernel that rejects duck-typed operands."""
+    raise TypeError("rejected operands")
+
+class RejectingOperation(TemplateOperation):
+    """Operation whose plain-method execute raises TypeError."""
+
+    def execute(self, a: float, b: float) -> float:
+        """Reject every operand pair."""
+        return _reject(a, b)
+
+class StaticRejectingOperation(TemplateOperation):
+    """Rejecting operation with a staticmethod execute (frameless variant)."""
+
+    execute = staticmethod(_reject)
+
+class GenericRejectingOperation(TemplateOperation):
+    """Rejecting operation routed through the generic template method."""
+
+    calculate = TemplateOperation.calculate  # Explicit override: no specialization.
+
+    def execute(self, a: float, b: float) -> float:
+        """Reject every operand pair."""
+        return _reject(a, b)
+
 def test_validate_inputs():
     """Test that validate_inputs raises ValueError for invalid inputs."""
     operation = ConcreteOperation()  # Instantiate the concrete class to test validate_inputs
+    operation.validate_inputs(1, 2.5)  # Exact numeric types take the fast path.
     with pytest.raises(ValueError):
         operation.validate_inputs(1, "a")  # Invalid input
     with pytest.raises(ValueError):
         operation.validate_inputs("b", 2)  # Invalid input
 
+def test_explicit_calculate_override_is_respected():
+    """Test that __init_subclass__ leaves a declared calculate untouched."""
+    assert GenericOperation.calculate is TemplateOperation.calculate
+    assert GenericOperation().calculate(7, 3) == 4
+
+def test_subclass_without_execute_keeps_generic_calculate():
+    """Test that a subclass with no execute gets no specialized calculate."""
+    class IncompleteOperation(TemplateOperation):
+        """No execute: nothing to specialize against."""
+
+    assert IncompleteOperation.calculate is TemplateOperation.calculate
+
+def test_generic_calculate_memoizes_and_skips_nan():
+    """Test the generic template's memo route and its non-cacheable route."""
+    operation = GenericOperation()
+    assert operation.calculate(9.0, 4.0) == 5.0  # Miss: fills a memo slot.
+    assert operation.calculate(9.0, 4.0) == 5.0  # Hit via the memo table.
+    assert math.isnan(operation.calculate(float("nan"), 1.0))  # Bypasses the table.
+
+def test_generic_calculate_rejects_non_numeric_operands():
+    """Test that the generic template guards operands like the closures do."""
+    with pytest.raises(ValueError, match="Both inputs must be numbers."):
+        GenericOperation().calculate("a", 1)
+
+@pytest.mark.parametrize("operation", [
+    RejectingOperation(),         # Plain-method closure variant.
+    StaticRejectingOperation(),   # Staticmethod closure variant.
+    GenericRejectingOperation(),  # Generic template method.
+])
+def test_calculate_translates_type_error(operation):
+    """Test that a TypeError out of execute surfaces as the standard ValueError."""
+    with pytest.raises(ValueError, match="Both inputs must be numbers."):
+        operation.calculate(1, 2)
+
+def test_calculate_logs_results_at_info(caplog):
+    """Test that every calculate variant records results when INFO is enabled."""
+    caplog.set_level(logging.INFO)
+    ConcreteOperation().calculate(2, 3)  # Plain-method closure.
+    Addition().calculate(4, 5)           # Staticmethod closure.
+    GenericOperation().calculate(9, 1)   # Generic template method.
+    flush_log_results()  # Results are buffered; drain them into the log.
+    assert "Operation performed: 2 and 3 -> Result: 5" in caplog.text
+    assert "Operation performed: 4 and 5 -> Result: 9" in caplog.text
+    assert "Operation performed: 9 and 1 -> Result: 8" in caplog.text
+
+@pytest.mark.parametrize("operation, a, b", [
+    (Addition(), "a", "b"),        # str + str would concatenate, not fail.
+    (Multiplication(), "a", 3),    # str * int would repeat, not fail.
+    (Addition(), 1, "b"),
+    (ConcreteOperation(), "a", 2),
+])
+def test_calculate_rejects_non_numeric_operands(operation, a, b):
+    """Test that calculate raises ValueError even where the operator would
+    happily accept the operands (string concatenation/repetition)."""
+    with pytest.raises(ValueError, match="Both inputs must be numbers."):
+        operation.calculate(a, b)
+
 def test_log_result(caplog):
     """Test that log_result logs the expected message."""
+    caplog.set_level(logging.INFO)  # INFO is filtered out by default; see app.history.logger.
     operation = ConcreteOperation()  # Instantiate the concrete class to test log_result
     operation.log_result(2, 3, 5)  # Call log_result with sample values
+    flush_log_results()  # Results are buffered; drain them into the log.
     assert (
         "Operation performed: 2 and 3 -> Result: 5"
         in caplog.text
     ), "Log message is incorrect."  # Add an assertion message for clarity
 
+def test_log_buffer_flushes_automatically_when_full(caplog):
+    """Test that filling the buffer to capacity drains it without an
+    explicit flush."""
+    caplog.set_level(logging.INFO)  # INFO is filtered out by default; see app.history.logger.
+    flush_log_results()  # Start empty so the fill count is exact.
+    operation = ConcreteOperation()
+    for i in range(_result_buffer._records.maxlen):  # Exactly buffer capacity.
+        operation.log_result(i, i, i + i)
+    assert "Operation performed: 0 and 0 -> Result: 0" in caplog.text
+    assert len(_result_buffer._records) == 0, "The full buffer should self-drain."
+
+def test_log_result_is_noop_when_info_disabled():
+    """Test that log_result buffers nothing while INFO logging is off."""
+    flush_log_results()  # Start from an empty buffer.
+    ConcreteOperation().log_result(2, 3, 5)  # INFO is disabled by default.
+    assert len(_result_buffer._records) == 0, "Nothing should be buffered."
+
 def test_concrete_operation_execute():
     """Test that the concrete implementation of execute works as expected."""
     operation = ConcreteOperation()
     result = operation.execute(3, 4)
     assert result == 7  # Confirm that the result of the addition is correct
+
+def test_specialized_kernels_log_results_at_info(caplog):
+    """Test that both specialize() kernel variants keep the INFO trail."""
+    caplog.set_level(logging.INFO)
+    static_kernel = Addition.specialize(int, int)  # Staticmethod execute.
+    assert static_kernel(Addition(), 12, 30) == 42
+    plain_kernel = ConcreteOperation.specialize(float, int)  # Plain-method execute.
+    assert plain_kernel(ConcreteOperation(), 1.5, 2) == 3.5
+    flush_log_results()  # Results are buffered; drain them into the log.
+    assert "Operation performed: 12 and 30 -> Result: 42" in caplog.text
+    assert "Operation performed: 1.5 and 2 -> Result: 3.5" in caplog.text
+
+def test_specialize_unknown_types_falls_back_to_calculate():
+    """Test that non-numeric operand types get the full template method."""
+    assert Addition.specialize(str, str) is Addition.calculate
+
+def test_memo_hit_skips_execute():
+    """Test that a repeated calculate call is served from the memo table."""
+    operation = MemoizedOperation()
+    MemoizedOperation.calls = 0
+    assert operation.calculate(1.25, 2.5) == 3.75  # Miss: computes and fills a slot.
+    assert operation.calculate(1.25, 2.5) == 3.75  # Hit: served without executing.
+    assert MemoizedOperation.calls == 1, "The second call must not re-execute."
+
+def test_memo_collision_overwrites_slot():
+    """Test that a colliding key overwrites the slot and evicts the old entry."""
+    operation = MemoizedOperation()
+    first_key = (MemoizedOperation, 0.0, 2.0)
+    index = hash(first_key) % _MEMO_SIZE
+    # Search for a second operand pair that maps to the same slot.
+    collider = next(
+        x for x in (float(i) for i in range(1, 1_000_000))
+        if hash((MemoizedOperation, x, 2.0)) % _MEMO_SIZE == index
+    )
+
+    operation.calculate(0.0, 2.0)
+    assert _MEMO_SLOTS[index][0] == first_key, "The miss should fill its slot."
+    operation.calculate(collider, 2.0)  # Same slot: overwrites, no chaining.
+    assert _MEMO_SLOTS[index][0] == (MemoizedOperation, collider, 2.0)
+
+    MemoizedOperation.calls = 0
+    operation.calculate(0.0, 2.0)  # The evicted key misses and recomputes.
+    assert MemoizedOperation.calls == 1, "An evicted entry must re-execute."
+
+def test_memo_skips_nan_operands():
+    """Test that NaN operands bypass the memo table entirely."""
+    operation = MemoizedOperation()
+    MemoizedOperation.calls = 0
+    nan = float("nan")
+    assert math.isnan(operation.calculate(nan, 1.0))
+    assert math.isnan(operation.calculate(nan, 1.0))
+    # NaN != NaN, so such a key could never hit its own entry; _cacheable
+    # keeps it out of the table and both calls execute for real.
+    assert MemoizedOperation.calls == 2, "NaN operands must never be cached."